@@ -22,6 +22,8 @@ import six
 class EquivalenceMap(object):
     """Union-find data structure"""
 
+    __slots__ = ('_weights', '_parents', '_prev_next', '_min_values', '_readonly')
+
     supports_readonly = True
 
     def __init__(self, existing=None, _readonly=False):
@@ -29,7 +31,8 @@ class EquivalenceMap(object):
         if isinstance(existing, EquivalenceMap):
             self._weights = existing._weights.copy()
             self._parents = existing._parents.copy()
-            self._prev_next = existing._prev_next.copy()
+            # The [prev, next] link lists are mutated in place by union, so they must not be shared.
+            self._prev_next = {k: list(v) for k, v in six.viewitems(existing._prev_next)}
             self._min_values = existing._min_values.copy()
         else:
             self._weights = {}
@@ -36,7 +36,8 @@ def json_encoder_default(obj):
     elif isinstance(obj, np.ndarray):
         return list(obj)
     elif isinstance(obj, (set, frozenset)):
-        return list(obj)
+        # Convert uint64 segment ids here rather than calling back into this function per element.
+        return [str(x) if isinstance(x, np.integer) else x for x in obj]
     raise TypeError
 
 def json_encoder_default_for_repr(obj):
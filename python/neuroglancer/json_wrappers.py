@@ -17,6 +17,7 @@ from __future__ import absolute_import
 
 import collections
 import copy
+import functools
 import inspect
 import numbers
 import threading
@@ -74,19 +75,28 @@ class JsonObjectWrapper(object):
     def __deepcopy__(self, memo):
         return type(self)(copy.deepcopy(self.to_json(), memo))
 
+    def _fast_clone(self):
+        """Returns a writable copy that shares unmodified nested JSON values with `self`."""
+        json_data = self.to_json()
+        if self._readonly:
+            json_data = copy.copy(json_data)
+        return type(self)(json_data)
+
     def __repr__(self):
         return u'%s(%s)' % (type(self).__name__, encode_json_for_repr(self.to_json()))
 
-    def _get_wrapped(self, key, wrapped_type):
+    def _get_wrapped(self, key, wrapped_type, readonly_wrapped_type=None):
         with self._lock:
             json_value = self._json_data.get(key)
             cached_value = self._cached_wrappers.get(key)
             if cached_value is not None and cached_value[1] is json_value:
                 return cached_value[0]
-            kwargs = dict()
-            if self._readonly and hasattr(wrapped_type, 'supports_readonly'):
-                kwargs['_readonly'] = True
-            wrapper = wrapped_type(json_value, **kwargs)
+            if self._readonly:
+                if readonly_wrapped_type is None:
+                    readonly_wrapped_type = readonly_wrapper(wrapped_type)
+                wrapper = readonly_wrapped_type(json_value)
+            else:
+                wrapper = wrapped_type(json_value)
             self._cached_wrappers[key] = wrapper, json_value
             return wrapper
 
@@ -113,11 +123,25 @@ def _normalize_validator(wrapped_type, validator):
     return validator
 
 
+def readonly_wrapper(wrapped_type):
+    """Returns a function that constructs read-only values of `wrapped_type`, if supported."""
+    if hasattr(wrapped_type, 'supports_readonly'):
+        return functools.partial(wrapped_type, _readonly=True)
+    return wrapped_type
+
+
 def wrapped_property(json_name, wrapped_type, validator=None, doc=None):
+    # Resolve the validator and read-only constructor once per property rather than on each access.
     validator = _normalize_validator(wrapped_type, validator)
-    return property(fget=lambda self: self._get_wrapped(json_name, wrapped_type),
-                    fset=lambda self, value: self._set_wrapped(json_name, value, validator),
-                    doc=doc)
+    readonly_wrapped_type = readonly_wrapper(wrapped_type)
+
+    def fget(self):
+        return self._get_wrapped(json_name, wrapped_type, readonly_wrapped_type)
+
+    def fset(self, value):
+        return self._set_wrapped(json_name, value, validator)
+
+    return property(fget=fget, fset=fset, doc=doc)
 
 
 def array_wrapper(dtype, shape=None):
@@ -157,11 +181,12 @@ def optional(wrapper, default_value=None):
     return modified_wrapper
 
 class MapBase(object):
-    pass
+    __slots__ = ()
 
 def typed_string_map(wrapped_type, validator=None):
     validator = _normalize_validator(wrapped_type, validator)
     class Map(JsonObjectWrapper, MapBase):
+        __slots__ = ()
         supports_validation = True
 
         def __init__(self, json_data=None, _readonly=False):
@@ -240,7 +265,14 @@ def typed_set(wrapped_type):
 
 def typed_list(wrapped_type, validator=None):
     validator = _normalize_validator(wrapped_type, validator)
+    if hasattr(wrapped_type, 'supports_readonly'):
+        readonly_validator = readonly_wrapper(wrapped_type)
+    else:
+        readonly_validator = validator
+    # Arrays of a numpy scalar type can be converted in a single call rather than per element.
+    is_numpy_scalar_type = isinstance(wrapped_type, type) and issubclass(wrapped_type, np.generic)
     class TypedList(object):
+        __slots__ = ('_data', '_readonly', '_json_cache')
         supports_readonly = True
         supports_validation = True
         def __init__(self, json_data=None, _readonly=False):
@@ -249,7 +281,13 @@ def typed_list(wrapped_type, validator=None):
             if not isinstance(json_data, (list, tuple, np.ndarray)):
                 raise ValueError
             self._readonly = _readonly
-            self._data = [validator(x) for x in json_data]
+            self._json_cache = None
+            if is_numpy_scalar_type and isinstance(json_data, np.ndarray) and json_data.ndim == 1:
+                self._data = list(json_data.astype(wrapped_type, copy=False))
+            elif _readonly:
+                self._data = [readonly_validator(x) for x in json_data]
+            else:
+                self._data = [validator(x) for x in json_data]
 
         def __len__(self):
             return len(self._data)
@@ -292,6 +330,11 @@ def typed_list(wrapped_type, validator=None):
             return self._data.pop(index)
 
         def to_json(self):
+            if self._readonly:
+                # The list and its elements are immutable, so the JSON only needs to be built once.
+                if self._json_cache is None:
+                    self._json_cache = [to_json(x) for x in self._data]
+                return self._json_cache
             return [to_json(x) for x in self._data]
 
         def __deepcopy__(self, memo):
@@ -300,3 +343,105 @@ def typed_list(wrapped_type, validator=None):
         def __repr__(self):
             return encode_json_for_repr(self.to_json())
     return TypedList
+
+def packed_array_list(dtype, ncols):
+    """List of `ncols`-element vectors stored packed in a single `(N, ncols)` array.
+
+    Behaves like `typed_list(array_wrapper(dtype, ncols))`, but avoids allocating a separate array
+    per element.  Indexing returns views into the packed array.
+    """
+    def validate_rows(value):
+        value = np.array(value, dtype=dtype)
+        if value.ndim == 1 and value.size == 0:
+            value = value.reshape(0, ncols)
+        if value.ndim != 2 or value.shape[1] != ncols:
+            raise ValueError('expected shape', (None, ncols))
+        return value
+
+    class PackedArrayList(object):
+        __slots__ = ('_array', '_size', '_readonly')
+        supports_readonly = True
+        supports_validation = True
+        def __init__(self, json_data=None, _readonly=False):
+            if json_data is None:
+                json_data = []
+            elif isinstance(json_data, PackedArrayList):
+                json_data = json_data.array
+            if not isinstance(json_data, (list, tuple, np.ndarray)):
+                raise ValueError
+            self._readonly = _readonly
+            self._array = validate_rows(json_data)
+            self._size = len(self._array)
+            if _readonly:
+                self._array.setflags(write=False)
+
+        @property
+        def array(self):
+            """The `(N, ncols)` array of elements."""
+            return self._array[:self._size]
+
+        def _reserve(self, size):
+            if size <= len(self._array):
+                return
+            new_array = np.empty((max(size, 2 * len(self._array)), ncols), dtype=dtype)
+            new_array[:self._size] = self.array
+            self._array = new_array
+
+        def __len__(self):
+            return self._size
+
+        def __getitem__(self, key):
+            return self.array[key]
+
+        def __delitem__(self, key):
+            if self._readonly:
+                raise AttributeError
+            self._array = np.delete(self.array, key, axis=0)
+            self._size = len(self._array)
+
+        def __setitem__(self, key, value):
+            if self._readonly:
+                raise AttributeError
+            if isinstance(key, numbers.Integral):
+                self.array[key] = validate_rows([value])[0]
+            else:
+                self.array[key] = validate_rows(value)
+
+        def __iter__(self):
+            return iter(self.array)
+
+        def append(self, x):
+            if self._readonly:
+                raise AttributeError
+            self.extend([x])
+
+        def extend(self, values):
+            if self._readonly:
+                raise AttributeError
+            if not isinstance(values, np.ndarray):
+                values = list(values)
+            values = validate_rows(values)
+            self._reserve(self._size + len(values))
+            self._array[self._size:self._size + len(values)] = values
+            self._size += len(values)
+
+        def insert(self, index, x):
+            if self._readonly:
+                raise AttributeError
+            self._array = np.insert(self.array, index, validate_rows([x]), axis=0)
+            self._size = len(self._array)
+
+        def pop(self, index=-1):
+            x = self[index].copy()
+            del self[index]
+            return x
+
+        def to_json(self):
+            return self.array.tolist()
+
+        def __deepcopy__(self, memo):
+            return type(self)(self.array)
+
+        def __repr__(self):
+            return encode_json_for_repr(self.to_json())
+    return PackedArrayList
@@ -33,13 +33,21 @@ DOUBLE_OR_SINGLE_QUOTE_STRING_PATTERN = DOUBLE_QUOTE_STRING_PATTERN + u'|' + SIN
 DOUBLE_QUOTE_PATTERN = u'^((?:[^"\'\\\\]|(?:\\\\.))*)"'
 SINGLE_QUOTE_PATTERN = u'^((?:[^"\'\\\\]|(?:\\\\.))*)\''
 
+_SINGLE_OR_DOUBLE_QUOTE_STRING_REGEX = re.compile(SINGLE_OR_DOUBLE_QUOTE_STRING_PATTERN)
+_DOUBLE_OR_SINGLE_QUOTE_STRING_REGEX = re.compile(DOUBLE_OR_SINGLE_QUOTE_STRING_PATTERN)
+_DOUBLE_QUOTE_REGEX = re.compile(DOUBLE_QUOTE_PATTERN)
+_SINGLE_QUOTE_REGEX = re.compile(SINGLE_QUOTE_PATTERN)
+
 
 def _convert_string_literal(x, quote_initial, quote_replace, quote_search):
     if len(x) >= 2 and x[0] == quote_initial and x[-1] == quote_initial:
+        if not hasattr(quote_search, 'search'):
+            # Also accept a pattern string, e.g. `DOUBLE_QUOTE_PATTERN`.
+            quote_search = re.compile(quote_search)
         inner = x[1:-1]
         s = quote_replace
         while inner:
-            m = re.search(quote_search, inner)
+            m = quote_search.search(inner)
             if m is None:
                 s += inner
                 break
@@ -53,18 +61,17 @@ def _convert_string_literal(x, quote_initial, quote_replace, quote_search):
 
 
 def _convert_json_helper(x, desired_comma_char, desired_quote_char):
-    comma_search = u'[&_,]'
     if desired_quote_char == u'"':
         quote_initial = u'\''
-        quote_search = DOUBLE_QUOTE_PATTERN
-        string_literal_pattern = SINGLE_OR_DOUBLE_QUOTE_STRING_PATTERN
+        quote_search = _DOUBLE_QUOTE_REGEX
+        string_literal_regex = _SINGLE_OR_DOUBLE_QUOTE_STRING_REGEX
     else:
         quote_initial = u'"'
-        quote_search = SINGLE_QUOTE_PATTERN
-        string_literal_pattern = DOUBLE_OR_SINGLE_QUOTE_STRING_PATTERN
+        quote_search = _SINGLE_QUOTE_REGEX
+        string_literal_regex = _DOUBLE_OR_SINGLE_QUOTE_STRING_REGEX
     s = u''
     while x:
-        m = re.search(string_literal_pattern, x)
+        m = string_literal_regex.search(x)
         if m is None:
             before = x
             x = u''
@@ -77,7 +84,8 @@ def _convert_json_helper(x, desired_comma_char, desired_quote_char):
                 replacement = _convert_string_literal(original_string, quote_initial, desired_quote_char, quote_search)
             else:
                 replacement = m.group(2)
-        s += re.sub(comma_search, desired_comma_char, before)
+        s += before.replace(u'&', desired_comma_char).replace(u'_', desired_comma_char).replace(
+            u',', desired_comma_char)
         s += replacement
     return s
 
@@ -16,6 +16,7 @@
 
 from __future__ import absolute_import
 
+import array
 import collections
 import copy
 import math
@@ -23,12 +24,18 @@ import math
 import numpy as np
 import six
 
+try:
+    import collections.abc as collections_abc
+except ImportError:
+    collections_abc = collections
+
 from . import local_volume
 from . import skeleton
 from .equivalence_map import EquivalenceMap
 from .json_utils import encode_json_for_repr
-from .json_wrappers import (JsonObjectWrapper, array_wrapper, optional, text_type, typed_list,
-                            typed_set, typed_string_map, wrapped_property)
+from .json_wrappers import (JsonObjectWrapper, array_wrapper, optional, packed_array_list,
+                            readonly_wrapper, text_type, typed_list, typed_string_map,
+                            wrapped_property)
 
 __all__ = []
 
@@ -41,13 +48,26 @@ def export(obj):
 def interpolate_linear(a, b, t):
     return a * (1 - t) + b * t
 
-def interpolate_linear_optional_vectors(a, b, t):
+def interpolate_linear_optional_vectors(a, b, t, out=None):
+    """Linearly interpolates between `a` and `b`, or returns `a` if they are not compatible.
+
+    If `out` is specified, the result is computed in place in it without allocating any temporary
+    arrays.  `out` may be `b` but must not be `a`.
+    """
     if a is not None and b is not None and len(a) == len(b):
-        return a * (1 - t) + b * t
+        if out is None:
+            return a * (1 - t) + b * t
+        np.subtract(b, a, out=out)
+        out *= t
+        out += a
+        return out
     return a
 
+_UNIT_QUATERNION = np.array([0, 0, 0, 1], np.float32)
+_UNIT_QUATERNION.setflags(write=False)
+
 def unit_quaternion():
-    return np.array([0, 0, 0, 1], np.float32)
+    return _UNIT_QUATERNION.copy()
 
 
 def quaternion_slerp(a, b, t):
@@ -56,32 +76,168 @@ def quaternion_slerp(a, b, t):
     This is based on the implementation in the gl-matrix package:
     https://github.com/toji/gl-matrix
     """
+    # Missing quaternions default to the unit quaternion, matching the shape of the other operand.
     if a is None:
-        a = unit_quaternion()
+        a = _UNIT_QUATERNION
+        if type(b) is np.ndarray and b.ndim > 1:
+            a = np.broadcast_to(a, b.shape)
     if b is None:
-        b = unit_quaternion()
+        b = _UNIT_QUATERNION
+        if type(a) is np.ndarray and a.ndim > 1:
+            b = np.broadcast_to(b, a.shape)
+    if (type(a) is np.ndarray and a.ndim > 1) or (type(b) is np.ndarray and b.ndim > 1):
+        return quaternion_slerp_batch(a, b, t)
+    kernel = (_quaternion_slerp_njit
+              if _quaternion_slerp_njit_loaded else _get_quaternion_slerp_njit())
+    if kernel is not None and _is_float32_quaternion(a) and _is_float32_quaternion(b):
+        return kernel(a, b, float(t))
     # calc cosine
-    cosom = np.dot(a, b)
+    cosom = float(np.dot(a, b))
     # adjust signs (if necessary)
     if cosom < 0.0:
         cosom = -cosom
         b = -b
 
-    # calculate coefficients
-    if (1.0 - cosom) > 0.000001:
-        # standard case (slerp)
-        omega = math.acos(cosom)
-        sinom = math.sin(omega)
-        scale0 = math.sin((1.0 - t) * omega) / sinom
-        scale1 = math.sin(t * omega) / sinom
-    else:
+    if cosom >= 0.9995:
         # "from" and "to" quaternions are very close
-        #  ... so we can do a linear interpolation
-        scale0 = 1.0 - t
-        scale1 = t
+        #  ... so we can do a normalized linear interpolation
+        c = (1.0 - t) * a + t * b
+        return c / np.linalg.norm(c)
+
+    # standard case (slerp)
+    # sin(acos(x)) == sqrt(1 - x^2)
+    sinom = math.sqrt(1.0 - cosom * cosom)
+    omega = math.acos(cosom)
+    scale0 = math.sin((1.0 - t) * omega) / sinom
+    scale1 = math.sin(t * omega) / sinom
     return scale0 * a + scale1 * b
 
 
+def _is_float32_quaternion(x):
+    return isinstance(x, np.ndarray) and x.dtype == np.float32 and x.shape == (4, )
+
+
+def _quaternion_slerp_kernel(a, b, t):
+    """Equivalent of `quaternion_slerp` for float32 quaternions, written to be compiled by numba."""
+    cosom = 0.0
+    for i in range(4):
+        cosom += a[i] * b[i]
+    sign = 1.0
+    if cosom < 0.0:
+        cosom = -cosom
+        sign = -1.0
+    out = np.empty(4, np.float32)
+    if cosom >= 0.9995:
+        norm = 0.0
+        for i in range(4):
+            out[i] = (1.0 - t) * a[i] + sign * t * b[i]
+            norm += out[i] * out[i]
+        norm = math.sqrt(norm)
+        for i in range(4):
+            out[i] /= norm
+        return out
+    sinom = math.sqrt(1.0 - cosom * cosom)
+    omega = math.acos(cosom)
+    scale0 = math.sin((1.0 - t) * omega) / sinom
+    scale1 = sign * math.sin(t * omega) / sinom
+    for i in range(4):
+        out[i] = scale0 * a[i] + scale1 * b[i]
+    return out
+
+
+_quaternion_slerp_njit = None
+_quaternion_slerp_njit_loaded = False
+
+
+def _get_quaternion_slerp_njit():
+    """Returns the compiled `_quaternion_slerp_kernel`, or `None` if numba is not available.
+
+    numba is imported on first use, rather than along with this module, since it is slow to import.
+    """
+    global _quaternion_slerp_njit, _quaternion_slerp_njit_loaded  # pylint: disable=global-statement
+    if not _quaternion_slerp_njit_loaded:
+        _quaternion_slerp_njit_loaded = True
+        try:
+            import numba
+        except ImportError:
+            pass
+        else:
+            _quaternion_slerp_njit = numba.njit(cache=True, fastmath=True)(_quaternion_slerp_kernel)
+    return _quaternion_slerp_njit
+
+
+def quaternion_slerp_batch(a, b, t):
+    """Vectorized `quaternion_slerp` over the rows of `(N, 4)` arrays `a` and `b`.
+
+    `t` may be a scalar or an array of shape `(N,)`.
+    """
+    a = np.asarray(a)
+    b = np.asarray(b)
+    t = np.asarray(t, dtype=a.dtype)
+    cosom = np.einsum('ij,ij->i', a, b)
+    # adjust signs (if necessary)
+    b = np.where(cosom[:, np.newaxis] < 0, -b, b)
+    cosom = np.abs(cosom)
+    cosom = np.minimum(cosom, 1)
+    sinom = np.sqrt(1 - cosom * cosom)
+    omega = np.arccos(cosom)
+    # "from" and "to" quaternions that are very close use linear interpolation
+    linear = (1.0 - cosom) <= 0.000001
+    sinom = np.where(linear, 1, sinom)
+    scale0 = np.where(linear, 1 - t, np.sin((1 - t) * omega) / sinom)
+    scale1 = np.where(linear, t, np.sin(t * omega) / sinom)
+    return scale0[:, np.newaxis] * a + scale1[:, np.newaxis] * b
+
+
+def _make_fast_slerp_coeffs(n=8, mu=1.85298109240830):
+    coeffs = [(1.0 / (i * (2.0 * i + 1)), i / (2.0 * i + 1)) for i in range(1, n)]
+    coeffs.append((mu / (n * (2.0 * n + 1)), mu * n / (2.0 * n + 1)))
+    return tuple(coeffs)
+
+_fast_slerp_coeffs = _make_fast_slerp_coeffs()
+
+
+def quaternion_slerp_fast(a, b, t, out=None):
+    """Approximate spherical linear interpolation for unit quaternions.
+
+    Uses the polynomial approximation from David Eberly, "A Fast and Accurate Algorithm for
+    Computing SLERP", which avoids all trigonometric functions and has a maximum absolute error of
+    about 3e-5, and whose results are not exactly unit length.  Works on single quaternions as well
+    as on arrays of shape `(N, 4)`, in which case `t` may be a scalar or an array of shape `(N,)`.
+
+    Despite its name, this is not faster in NumPy: the polynomial evaluation takes about 50 ufunc
+    calls, about 55-60us per call for up to 100 quaternions, compared to about 25us for
+    `quaternion_slerp_batch` and about 3-5us for a scalar `quaternion_slerp`.  It is not used by
+    the interpolation code; prefer `quaternion_slerp` or `quaternion_slerp_batch`.
+
+    If `out` is specified, the result is stored in it, e.g. to reuse a result buffer across
+    animation frames.  The intermediate polynomial terms are still allocated.
+    """
+    if a is None:
+        a = _UNIT_QUATERNION
+    if b is None:
+        b = _UNIT_QUATERNION
+    if np.ndim(t):
+        # Broadcast per-row `t` against the quaternion components.
+        t = np.asarray(t)[..., np.newaxis]
+    x = np.sum(a * b, axis=-1, keepdims=True)
+    # adjust signs (if necessary)
+    sign = np.where(x < 0, -1, 1).astype(x.dtype)
+    x = x * sign
+    xm1 = x - 1
+    d = 1 - t
+    sqr_t = t * t
+    sqr_d = d * d
+    f_t = 1
+    f_d = 1
+    for u, v in reversed(_fast_slerp_coeffs):
+        f_t = 1 + (u * sqr_t - v) * xm1 * f_t
+        f_d = 1 + (u * sqr_d - v) * xm1 * f_d
+    out = np.multiply(d * f_d, a, out=out)
+    out += (sign * t * f_t) * b
+    return out
+
+
 def interpolate_zoom(a, b, t):
     if a is None or b is None:
         return a
@@ -197,7 +353,7 @@ class Layer(JsonObjectWrapper):
 
     @staticmethod
     def interpolate(a, b, t):
-        c = copy.deepcopy(a)
+        c = a._fast_clone()
         c.layer_position = interpolate_linear_optional_vectors(a.layer_position, b.layer_position, t)
         return c
 
@@ -208,7 +364,7 @@ class PointAnnotationLayer(Layer):
     def __init__(self, *args, **kwargs):
         super(PointAnnotationLayer, self).__init__(*args, type='pointAnnotation', **kwargs)
 
-    points = wrapped_property('points', typed_list(array_wrapper(np.float32, 3)))
+    points = wrapped_property('points', packed_array_list(np.float32, 3))
 
 @export
 class CoordinateSpaceTransform(JsonObjectWrapper):
@@ -285,6 +441,34 @@ def uint64_equivalence_map(obj, _readonly=False):
     return EquivalenceMap(obj, _readonly=_readonly)
 
 
+def _check_uint64(x):
+    v = int(x)
+    if v < 0 or v >> 64:
+        raise ValueError('uint64 value out of range: %r' % (x, ))
+    return v
+
+
+def uint64_set(obj, _readonly=False):
+    set_type = frozenset if _readonly else set
+    if obj is None:
+        return set_type()
+    if (isinstance(obj, (set, frozenset))
+            and all(type(v) is np.uint64 for v in obj)):  # pylint: disable=unidiomatic-typecheck
+        # Copying the segments of another layer: convert in a single pass.  Other sets take the
+        # checked path below, since numpy may wrap out-of-range integers.
+        return set_type(np.fromiter(obj, dtype=np.uint64, count=len(obj)))
+    if isinstance(obj, array.array):
+        obj = np.asarray(obj)
+    if isinstance(obj, np.ndarray) and obj.dtype.kind in 'iu':
+        if obj.dtype.kind == 'i' and obj.size and obj.min() < 0:
+            raise ValueError('uint64 value out of range: %r' % (obj.min(), ))
+        return set_type(obj.astype(np.uint64, copy=False).ravel())
+    return set_type(np.array([_check_uint64(v) for v in obj], dtype=np.uint64))
+
+
+uint64_set.supports_readonly = True
+
+
 @export
 class SegmentationLayer(Layer, _AnnotationLayerOptions):
     __slots__ = ()
@@ -293,7 +477,7 @@ class SegmentationLayer(Layer, _AnnotationLayerOptions):
         super(SegmentationLayer, self).__init__(*args, type='segmentation', **kwargs)
 
     source = wrapped_property('source', LayerDataSources)
-    segments = wrapped_property('segments', typed_set(np.uint64))
+    segments = wrapped_property('segments', uint64_set)
     equivalences = wrapped_property('equivalences', uint64_equivalence_map)
     hide_segment_zero = hideSegmentZero = wrapped_property('hideSegmentZero', optional(bool, True))
     selected_alpha = selectedAlpha = wrapped_property('selectedAlpha', optional(float, 0.5))
@@ -347,6 +531,40 @@ class PointAnnotation(AnnotationBase):
 
     point = wrapped_property('point', array_wrapper(np.float32, 3))
 
+    @classmethod
+    def from_arrays(cls, points, ids=None, _readonly=False):
+        """Returns a list of point annotations, one for each row of the `(N, 3)` array `points`.
+
+        The points are copied once into a single float32 array, and the `point` of each annotation
+        is a view into that array.  The JSON data of the annotations only contains plain lists.
+        """
+        points = np.array(points, dtype=np.float32)
+        if points.ndim != 2 or points.shape[1] != 3:
+            raise ValueError('expected shape', (None, 3))
+        if ids is None:
+            ids = [None] * len(points)
+        elif len(ids) != len(points):
+            raise ValueError('expected %d ids' % len(points))
+        if _readonly:
+            points.setflags(write=False)
+            # Read-only annotations return their JSON data directly from `to_json`.
+            json_points = points.tolist()
+        else:
+            # Writable annotations serialize the cached view instead.
+            json_points = [None] * len(points)
+        result = []
+        for point, json_point, annotation_id in zip(points, json_points, ids):
+            json_data = collections.OrderedDict([('type', 'point')])
+            if annotation_id is not None:
+                json_data['id'] = text_type(annotation_id)
+            if json_point is not None:
+                json_data['point'] = json_point
+            x = cls(json_data, _readonly=_readonly)
+            # Use the view as the wrapped value, rather than copying it on first access.
+            x._cached_wrappers['point'] = (point, json_point)
+            result.append(x)
+        return result
+
 
 @export
 class LineAnnotation(AnnotationBase):
@@ -402,6 +620,22 @@ def annotation(obj, _readonly=False):
 annotation.supports_readonly = True
 
 
+class AnnotationList(typed_list(annotation)):
+    """List of annotations; a writable list may also be constructed from an `(N, 3)` array."""
+    __slots__ = ()
+
+    def __init__(self, json_data=None, _readonly=False):
+        if isinstance(json_data, np.ndarray):
+            if _readonly:
+                # Read-only wrappers are only constructed from JSON data.
+                raise ValueError
+            super(AnnotationList, self).__init__()
+            # The annotations are newly created, so they are used directly rather than copied.
+            self._data = PointAnnotation.from_arrays(json_data)
+            return
+        super(AnnotationList, self).__init__(json_data, _readonly=_readonly)
+
+
 @export
 class AnnotationLayer(Layer, _AnnotationLayerOptions):
     __slots__ = ()
@@ -410,7 +644,7 @@ class AnnotationLayer(Layer, _AnnotationLayerOptions):
         super(AnnotationLayer, self).__init__(*args, type='annotation', **kwargs)
 
     source = wrapped_property('source', LayerDataSources)
-    annotations = wrapped_property('annotations', typed_list(annotation))
+    annotations = wrapped_property('annotations', AnnotationList)
     linked_segmentation_layer = linkedSegmentationLayer = wrapped_property('linkedSegmentationLayer', optional(text_type))
     filter_by_segmentation = filterBySegmentation = wrapped_property('filterBySegmentation', optional(bool, False))
 
@@ -440,27 +674,31 @@ layer_types = {
 }
 
 
-def make_layer(json_data, _readonly=False):
-    if isinstance(json_data, Layer):
-        return json_data
+_get_layer_type = layer_types.get
 
-    if isinstance(json_data, local_volume.LocalVolume):
-        json_data = dict(type=json_data.volume_type, source=json_data)
 
+def make_layer(json_data, _readonly=False):
+    # Check for the common case of JSON data first.
     if not isinstance(json_data, dict):
-        raise TypeError
+        if isinstance(json_data, Layer):
+            return json_data
+        if not isinstance(json_data, local_volume.LocalVolume):
+            raise TypeError
+        json_data = dict(type=json_data.volume_type, source=json_data)
 
-    type_name = json_data.get('type')
-    layer_type = layer_types.get(type_name)
+    layer_type = _get_layer_type(json_data.get('type'))
     if layer_type is not None:
         return layer_type(json_data, _readonly=_readonly)
     else:
         raise ValueError
 
 
+_MANAGED_LAYER_LOCAL_ATTRS = frozenset(['name', 'visible', 'layer'])
+
+
 @export
 class ManagedLayer(JsonObjectWrapper):
-    __slots__ = ('name', 'layer')
+    __slots__ = ('name', 'layer', '_json_cache')
 
     def __init__(self, name, layer=None, _readonly=False, **kwargs):
         if isinstance(name, ManagedLayer):
@@ -470,6 +708,7 @@ class ManagedLayer(JsonObjectWrapper):
             name = name.name
 
         object.__setattr__(self, 'name', name)
+        object.__setattr__(self, '_json_cache', None)
 
         if isinstance(layer, Layer):
             json_data = collections.OrderedDict()
@@ -492,9 +731,9 @@ class ManagedLayer(JsonObjectWrapper):
         return getattr(self.layer, key)
 
     def __setattr__(self, key, value):
-        if self._readonly:
+        if self._readonly is True:
             raise AttributeError
-        if key in ['name', 'visible', 'layer']:
+        if key in _MANAGED_LAYER_LOCAL_ATTRS:
             object.__setattr__(self, key, value)
         else:
             return setattr(self.layer, key, value)
@@ -504,20 +743,43 @@ class ManagedLayer(JsonObjectWrapper):
                                          encode_json_for_repr(self.to_json()))
 
     def to_json(self):
+        if self._readonly and self._json_cache is not None:
+            return self._json_cache
         r = self.layer.to_json()
+        if self._readonly:
+            # The read-only layer returns its underlying JSON, which must not be modified.
+            r = r.copy()
         r['name'] = self.name
         visible = self.visible
         if visible is not None:
             r['visible'] = visible
+        if self._readonly:
+            object.__setattr__(self, '_json_cache', r)
         return r
 
     def __deepcopy__(self, memo):
-        return ManagedLayer(self.name, copy.deepcopy(self.to_json(), memo))
+        layer = make_layer(copy.deepcopy(self.layer.to_json(), memo))
+        return ManagedLayer(self.name, layer, visible=self.visible)
+
+
+def add_managed_layer_properties():
+    # Reading a layer property through a ManagedLayer otherwise goes through the comparatively
+    # slow `__getattr__` fallback.  Assignment is still handled by `ManagedLayer.__setattr__`.
+    def make_property(key):
+        def fget(self):
+            return getattr(self.layer, key)
+        return property(fget=fget)
+
+    for layer_type in list(layer_types.values()) + [LocalAnnotationLayer]:
+        for k in dir(layer_type):
+            if isinstance(getattr(layer_type, k), property) and not hasattr(ManagedLayer, k):
+                setattr(ManagedLayer, k, make_property(k))
+add_managed_layer_properties()
 
 
 @export
 class Layers(object):
-    __slots__ = ('_layers', '_readonly')
+    __slots__ = ('_layers', '_readonly', '_name_to_index', '_json_cache')
     supports_readonly = True
 
     def __init__(self, json_data, _readonly=False):
@@ -525,7 +787,8 @@ class Layers(object):
             json_data = collections.OrderedDict()
         self._layers = []
         self._readonly = _readonly
-        if isinstance(json_data, collections.Mapping):
+        self._json_cache = None
+        if isinstance(json_data, dict) or isinstance(json_data, collections_abc.Mapping):
             for k, v in six.iteritems(json_data):
                 self._layers.append(ManagedLayer(k, v, _readonly=_readonly))
         else:
@@ -537,10 +800,23 @@ class Layers(object):
                     self._layers.append(ManagedLayer(text_type(layer['name']), layer, _readonly=_readonly))
                 else:
                     raise TypeError
+        self._rebuild_index()
+
+    def _rebuild_index(self):
+        name_to_index = {}
+        for i, u in enumerate(self._layers):
+            name_to_index.setdefault(u.name, i)
+        self._name_to_index = name_to_index
 
     def index(self, k):
+        i = self._name_to_index.get(k)
+        if i is not None and i < len(self._layers) and self._layers[i].name == k:
+            return i
+        # Layers may have been renamed since the index was built.  Only rebuild it if the name is
+        # actually present, so that repeated misses do not each allocate a new index.
         for i, u in enumerate(self._layers):
             if u.name == k:
+                self._rebuild_index()
                 return i
         return -1
 
@@ -575,6 +851,7 @@ class Layers(object):
                 if not isinstance(v, ManagedLayer):
                     raise TypeError
                 self._layers[k] = v
+        self._rebuild_index()
 
     def clear(self):
         """Clears the list of layers."""
@@ -587,6 +864,7 @@ class Layers(object):
         if isinstance(k, six.string_types):
             k = self.index(k)
         del self._layers[k]
+        self._rebuild_index()
 
     def append(self, *args, **kwargs):
         """Appends a ManagedLayer to the list of layers."""
@@ -597,6 +875,7 @@ class Layers(object):
         else:
             layer = ManagedLayer(*args, **kwargs)
         self._layers.append(layer)
+        self._name_to_index.setdefault(layer.name, len(self._layers) - 1)
 
     def extend(self, elements):
         for element in elements:
@@ -610,17 +889,22 @@ class Layers(object):
         return iter(self._layers)
 
     def to_json(self):
-        r = []
-        for x in self._layers:
-            r.append(x.to_json())
+        if self._readonly and self._json_cache is not None:
+            return self._json_cache
+        r = [x.to_json() for x in self._layers]
+        if self._readonly:
+            self._json_cache = r
         return r
 
     def __repr__(self):
         return repr(self._layers)
 
+    def _fast_clone(self):
+        return Layers(self.to_json())
+
     @staticmethod
     def interpolate(a, b, t):
-        c = copy.deepcopy(a)
+        c = a._fast_clone()
         for layer in c:
             index = b.index(layer.name)
             if index == -1:
@@ -641,23 +925,42 @@ def navigation_link_type(x):
     return x
 
 
+class _LinkedNavigationBase(JsonObjectWrapper):
+    __slots__ = ()
+    link = wrapped_property('link', optional(navigation_link_type, u'linked'))
+
+    # Set by `make_linked_navigation_type`.
+    _value_type = None
+    _readonly_value_type = None
+    _interpolate_function = None
+
+    @property
+    def value(self):
+        return self._get_wrapped('value', self._value_type, self._readonly_value_type)
+
+    @value.setter
+    def value(self, value):
+        self._set_wrapped('value', value, self._value_type)
+
+    @staticmethod
+    def interpolate(a, b, t):
+        c = a._fast_clone()
+        c.link = a.link
+        if a.link == b.link and a.link != 'linked':
+            c.value = a._interpolate_function(a.value, b.value, t)
+        return c
+
+
 def make_linked_navigation_type(value_type, interpolate_function=None):
     if interpolate_function is None:
         interpolate_function = value_type.interpolate
+    value_type = optional(value_type)
 
-    class LinkedType(JsonObjectWrapper):
+    class LinkedType(_LinkedNavigationBase):
         __slots__ = ()
-        link = wrapped_property('link', optional(navigation_link_type, u'linked'))
-        value = wrapped_property('value', optional(value_type))
-
-        @staticmethod
-        def interpolate(a, b, t):
-            c = copy.deepcopy(a)
-            c.link = a.link
-            if a.link == b.link and a.link != 'linked':
-                c.value = interpolate_function(a, b, t)
-                return c
-            return c
+        _value_type = staticmethod(value_type)
+        _readonly_value_type = staticmethod(readonly_wrapper(value_type))
+        _interpolate_function = staticmethod(interpolate_function)
 
     return LinkedType
 
@@ -695,7 +998,7 @@ class CrossSection(JsonObjectWrapper):
 
     @staticmethod
     def interpolate(a, b, t):
-        c = copy.deepcopy(a)
+        c = a._fast_clone()
         c.width = interpolate_linear(a.width, b.width, t)
         c.height = interpolate_linear(a.height, b.height, t)
         c.position = LinkedPosition.interpolate(a.position, b.position, t)
@@ -706,9 +1009,11 @@ class CrossSection(JsonObjectWrapper):
 
 @export
 class CrossSectionMap(typed_string_map(CrossSection)):
+    __slots__ = ()
+
     @staticmethod
     def interpolate(a, b, t):
-        c = copy.deepcopy(a)
+        c = a._fast_clone()
         for k in a:
             if k in b:
                 c[k] = CrossSection.interpolate(a[k], b[k], t)
@@ -738,7 +1043,7 @@ class DataPanelLayout(JsonObjectWrapper):
     def interpolate(a, b, t):
         if a.type != b.type or len(a.cross_sections) == 0:
             return a
-        c = copy.deepcopy(a)
+        c = a._fast_clone()
         c.cross_sections = CrossSectionMap.interpolate(a.cross_sections, b.cross_sections, t)
         return c
 
@@ -747,6 +1052,9 @@ def data_panel_layout_wrapper(default_value='xy'):
     def wrapper(x, _readonly=False):
         if x is None:
             x = default_value
+        elif isinstance(x, DataPanelLayout):
+            # `DataPanelLayout.to_json` may return just the type string.
+            x = x.to_json()
         if isinstance(x, six.string_types):
             x = {'type': six.text_type(x)}
         return DataPanelLayout(x, _readonly=_readonly)
@@ -799,12 +1107,16 @@ class StackLayout(JsonObjectWrapper):
 
     @staticmethod
     def interpolate(a, b, t):
-        if a.type != b.type or len(a.children) != len(b.children):
+        a_children = a.children
+        b_children = b.children
+        if a.type != b.type or len(a_children) != len(b_children):
             return a
-        c = copy.deepcopy(a)
+        c = a._fast_clone()
+        # Same as `interpolate_layout`, inlined to avoid an extra call per child.
         c.children = [
-            interpolate_layout(a_child, b_child, t)
-            for a_child, b_child in zip(a.children, b.children)
+            type(a_child).interpolate(a_child, b_child, t)
+            if type(a_child) is type(b_child) else a_child  # pylint: disable=unidiomatic-typecheck
+            for a_child, b_child in zip(a_children, b_children)
         ]
         return c
 
@@ -825,6 +1137,11 @@ def interpolate_layout(a, b, t):
     return type(a).interpolate(a, b, t)
 
 
+_LAYER_GROUP_VIEWER_INTERPOLATED_ATTRS = (
+    'layout', 'position', 'cross_section_orientation', 'cross_section_scale',
+    'cross_section_depth', 'projection_orientation', 'projection_scale', 'projection_depth')
+
+
 @export
 class LayerGroupViewer(JsonObjectWrapper):
     __slots__ = ()
@@ -842,8 +1159,7 @@ class LayerGroupViewer(JsonObjectWrapper):
     projection_depth = projectionDepth = wrapped_property('projectionDepth', LinkedDepthRange)
 
     def __init__(self, *args, **kwargs):
-        super(LayerGroupViewer, self).__init__(*args, **kwargs)
-        self.type = 'viewer'
+        super(LayerGroupViewer, self).__init__(*args, type='viewer', **kwargs)
 
     def __repr__(self):
         j = self.to_json()
@@ -852,9 +1168,8 @@ class LayerGroupViewer(JsonObjectWrapper):
 
     @staticmethod
     def interpolate(a, b, t):
-        c = copy.deepcopy(a)
-        for k in ('layout', 'position', 'cross_section_orientation', 'cross_section_zoom',
-                  'perspective_orientation', 'perspective_zoom'):
+        c = a._fast_clone()
+        for k in _LAYER_GROUP_VIEWER_INTERPOLATED_ATTRS:
             a_attr = getattr(a, k)
             b_attr = getattr(b, k)
             setattr(c, k, type(a_attr).interpolate(a_attr, b_attr, t))
@@ -875,6 +1190,7 @@ add_data_panel_layout_types()
 
 @export
 class SelectedLayerState(JsonObjectWrapper):
+    __slots__ = ()
     visible = wrapped_property('visible', optional(bool, False))
     size = wrapped_property('size', optional(int))
     layer = wrapped_property('layer', optional(text_type))
@@ -882,6 +1198,7 @@ class SelectedLayerState(JsonObjectWrapper):
 
 @export
 class StatisticsDisplayState(JsonObjectWrapper):
+    __slots__ = ()
     visible = wrapped_property('visible', optional(bool, False))
     size = wrapped_property('size', optional(int))
 
@@ -919,7 +1236,7 @@ class ViewerState(JsonObjectWrapper):
 
     @staticmethod
     def interpolate(a, b, t):
-        c = copy.deepcopy(a)
+        c = a._fast_clone()
         c.position = interpolate_linear_optional_vectors(a.position, b.position, t)
         c.projection_scale = interpolate_zoom(a.projection_scale, b.projection_scale, t)
         c.projection_orientation = quaternion_slerp(a.projection_orientation,
@@ -79,3 +79,12 @@ def test_isolate_element():
 
     m.isolate_element(1)
     assert [[2, 3], [4, 5]] == m.to_json()
+
+
+def test_copy_is_independent():
+    m = equivalence_map.EquivalenceMap([[1, 2], [3, 4]])
+    c = m.copy()
+    c.union(1, 3)
+    assert set([1, 2, 3, 4]) == set(c.members(1))
+    assert set([1, 2]) == set(m.members(1))
+    assert set([3, 4]) == set(m.members(3))
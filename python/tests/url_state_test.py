@@ -39,3 +39,8 @@ def test_url_safe_to_json():
     assert url_state.url_safe_to_json("""{'a':'b'_'b':'c'}""") == """{"a":"b","b":"c"}"""
     assert url_state.url_safe_to_json("""['a'_true]""") == """["a",true]"""
     assert url_state.url_safe_to_json("""['a',true]""") == """["a",true]"""
+
+
+def test_url_safe_to_json_separators():
+    assert (url_state.url_safe_to_json("""{'a':'b_c'&'b':['c'_1]}""") ==
+            """{"a":"b_c","b":["c",1]}""")
@@ -14,9 +14,13 @@
 
 from __future__ import absolute_import
 
-from neuroglancer import viewer_state
+from neuroglancer import json_utils, viewer_state
+import array
 import collections
+import copy
+import json
 import numpy as np
+import pytest
 
 def test_coordinate_space_from_json():
     x = viewer_state.CoordinateSpace(collections.OrderedDict([
@@ -56,3 +60,361 @@ def test_coordinate_space_from_split():
         ['z', [6e-9, 'm']],
         ['t', [2, 's']],
     ])
+
+def test_quaternion_slerp_batch():
+    rng = np.random.RandomState(0)
+    a = rng.randn(10, 4).astype(np.float32)
+    a /= np.linalg.norm(a, axis=1, keepdims=True)
+    b = rng.randn(10, 4).astype(np.float32)
+    b /= np.linalg.norm(b, axis=1, keepdims=True)
+    b[0] = a[0]
+    t = rng.rand(10)
+    expected = [viewer_state.quaternion_slerp(a[i], b[i], t[i]) for i in range(10)]
+    np.testing.assert_allclose(viewer_state.quaternion_slerp_batch(a, b, t), expected, atol=1e-5)
+    np.testing.assert_allclose(viewer_state.quaternion_slerp(a, b, t), expected, atol=1e-5)
+    unit = np.tile(viewer_state.unit_quaternion(), (10, 1))
+    np.testing.assert_allclose(viewer_state.quaternion_slerp(None, b, t),
+                               viewer_state.quaternion_slerp_batch(unit, b, t), atol=1e-6)
+    np.testing.assert_allclose(viewer_state.quaternion_slerp(a, None, t),
+                               viewer_state.quaternion_slerp_batch(a, unit, t), atol=1e-6)
+
+def _random_quaternion_pairs():
+    rng = np.random.RandomState(3)
+    a = rng.randn(10, 4)
+    a /= np.linalg.norm(a, axis=1, keepdims=True)
+    b = rng.randn(10, 4)
+    b /= np.linalg.norm(b, axis=1, keepdims=True)
+    # Include nearly identical and opposite quaternions.
+    b[0] = a[0] + 1e-3
+    b[0] /= np.linalg.norm(b[0])
+    b[1] = -a[1]
+    t = rng.rand(10)
+    expected = viewer_state.quaternion_slerp_batch(a, b, t)
+    return a.astype(np.float32), b.astype(np.float32), t, expected
+
+def test_quaternion_slerp_kernel():
+    a, b, t, expected = _random_quaternion_pairs()
+    for i in range(len(a)):
+        np.testing.assert_allclose(viewer_state._quaternion_slerp_kernel(a[i], b[i], t[i]),
+                                   expected[i], atol=1e-5)
+
+def test_quaternion_slerp_njit():
+    pytest.importorskip('numba')
+    kernel = viewer_state._get_quaternion_slerp_njit()
+    assert kernel is not None
+    a, b, t, expected = _random_quaternion_pairs()
+    for i in range(len(a)):
+        np.testing.assert_allclose(viewer_state.quaternion_slerp(a[i], b[i], t[i]), expected[i],
+                                   atol=1e-5)
+
+def test_quaternion_slerp_fast():
+    rng = np.random.RandomState(1)
+    for _ in range(100):
+        a = rng.randn(4).astype(np.float32)
+        a /= np.linalg.norm(a)
+        b = rng.randn(4).astype(np.float32)
+        b /= np.linalg.norm(b)
+        t = rng.rand()
+        np.testing.assert_allclose(viewer_state.quaternion_slerp_fast(a, b, t),
+                                   viewer_state.quaternion_slerp(a, b, t), atol=1e-4)
+    out = np.empty(4, np.float32)
+    assert viewer_state.quaternion_slerp_fast(a, b, t, out=out) is out
+    np.testing.assert_allclose(out, viewer_state.quaternion_slerp_fast(a, b, t))
+
+def test_quaternion_slerp_fast_batch():
+    rng = np.random.RandomState(2)
+    a = rng.randn(5, 4).astype(np.float32)
+    a /= np.linalg.norm(a, axis=1, keepdims=True)
+    b = rng.randn(5, 4).astype(np.float32)
+    b /= np.linalg.norm(b, axis=1, keepdims=True)
+    t = rng.rand(5)
+    expected = viewer_state.quaternion_slerp_batch(a, b, t)
+    np.testing.assert_allclose(viewer_state.quaternion_slerp_fast(a, b, t), expected, atol=1e-4)
+    np.testing.assert_allclose(viewer_state.quaternion_slerp_fast(a, b, 0.25),
+                               viewer_state.quaternion_slerp_batch(a, b, 0.25), atol=1e-4)
+
+def test_interpolate_linear_optional_vectors_out():
+    out = np.empty(3, np.float32)
+    result = viewer_state.interpolate_linear_optional_vectors(
+        np.array([0, 2, 4], np.float32), np.array([2, 4, 8], np.float32), 0.5, out=out)
+    assert result is out
+    np.testing.assert_allclose(out, [1, 3, 6])
+    b = np.array([2, 4, 8], np.float32)
+    viewer_state.interpolate_linear_optional_vectors(
+        np.array([0, 2, 4], np.float32), b, 0.25, out=b)
+    np.testing.assert_allclose(b, [0.5, 2.5, 5])
+
+def test_quaternion_slerp_nearby():
+    a = np.array([0, 0, 0, 1], np.float32)
+    b = np.array([0, 0.01, 0, 1], np.float32)
+    b /= np.linalg.norm(b)
+    c = viewer_state.quaternion_slerp(a, b, 0.5)
+    np.testing.assert_allclose(np.linalg.norm(c), 1, rtol=1e-6)
+    expected = viewer_state.quaternion_slerp_batch(a[np.newaxis].astype(np.float64),
+                                                   b[np.newaxis].astype(np.float64), 0.5)[0]
+    np.testing.assert_allclose(c, expected, atol=1e-6)
+
+def test_point_annotation_layer_points():
+    layer = viewer_state.PointAnnotationLayer(points=[[1, 2, 3], [4, 5, 6]])
+    points = layer.points
+    assert len(points) == 2
+    np.testing.assert_array_equal(points[1], [4, 5, 6])
+    for i in range(10):
+        points.append([i, i, i])
+    assert len(points) == 12
+    assert points.array.shape == (12, 3)
+    assert points.array.dtype == np.float32
+    del points[0]
+    np.testing.assert_array_equal(points.pop(), [9, 9, 9])
+    assert layer.to_json()['points'] == [[4, 5, 6]] + [[i, i, i] for i in range(9)]
+    readonly = viewer_state.PointAnnotationLayer(layer.to_json(), _readonly=True)
+    assert readonly.points.to_json() == layer.points.to_json()
+    with pytest.raises(AttributeError):
+        readonly.points.append([0, 0, 0])
+    for invalid in ([1, 2, 3], [[1, 2]], [[]]):
+        with pytest.raises(ValueError):
+            viewer_state.PointAnnotationLayer(points=invalid)
+    for invalid in ([1, 2], [[]]):
+        with pytest.raises(ValueError):
+            points.append(invalid)
+    with pytest.raises(ValueError):
+        points.extend([[]])
+    with pytest.raises(ValueError):
+        points[0] = 5
+    points[0] = [7, 8, 9]
+    np.testing.assert_array_equal(points[0], [7, 8, 9])
+    points[1:3] = [[1, 1, 1], [2, 2, 2]]
+    np.testing.assert_array_equal(points[1:3], [[1, 1, 1], [2, 2, 2]])
+    assert len(viewer_state.PointAnnotationLayer(points=[]).points) == 0
+
+def test_segmentation_layer_segments():
+    layer = viewer_state.SegmentationLayer({'type': 'segmentation',
+                                            'segments': ['1', '18446744073709551615']})
+    assert layer.segments == {np.uint64(1), np.uint64(18446744073709551615)}
+    assert all(isinstance(x, np.uint64) for x in layer.segments)
+    layer.segments = [3, 4]
+    assert layer.segments == {np.uint64(3), np.uint64(4)}
+    layer.segments = np.array([5, 6], dtype=np.int64)
+    assert layer.segments == {np.uint64(5), np.uint64(6)}
+    assert all(isinstance(x, np.uint64) for x in layer.segments)
+    layer.segments = array.array('L', [7])
+    assert layer.segments == {np.uint64(7)}
+    for invalid in ([-1], [1 << 64], np.array([-1]), {-1}, {1 << 64}, ['-1'],
+                    ['18446744073709551616'], ['1', '-2']):
+        with pytest.raises(ValueError):
+            layer.segments = invalid
+    readonly = viewer_state.SegmentationLayer({'type': 'segmentation', 'segments': ['5']},
+                                              _readonly=True)
+    assert readonly.segments == frozenset([np.uint64(5)])
+    layer.segments = readonly.segments
+    assert layer.segments == {np.uint64(5)}
+    layer.segments = {8, 9}
+    assert layer.segments == {np.uint64(8), np.uint64(9)}
+    assert isinstance(layer.segments, set)
+
+def test_segmentation_layer_segments_to_json():
+    layer = viewer_state.SegmentationLayer(segments=[1, 18446744073709551615])
+    encoded = json.loads(json_utils.encode_json(layer.to_json()))
+    assert sorted(encoded['segments']) == ['1', '18446744073709551615']
+
+def test_layer_interpolate():
+    a = viewer_state.ImageLayer(source='precomputed://a', opacity=0.2, layer_position=[0, 0])
+    b = viewer_state.ImageLayer(source='precomputed://a', opacity=0.6, layer_position=[2, 4])
+    c = viewer_state.ImageLayer.interpolate(a, b, 0.5)
+    assert c is not a
+    np.testing.assert_allclose(c.opacity, 0.4)
+    np.testing.assert_allclose(c.layer_position, [1, 2])
+    c.source[0].url = 'precomputed://c'
+    assert a.source[0].url == 'precomputed://a'
+    assert a.opacity == 0.2
+    readonly = viewer_state.ImageLayer(a.to_json(), _readonly=True)
+    c = viewer_state.ImageLayer.interpolate(readonly, b, 0.5)
+    np.testing.assert_allclose(c.opacity, 0.4)
+    assert readonly.to_json()['opacity'] == 0.2
+
+def test_readonly_typed_list():
+    layer = viewer_state.AnnotationLayer({
+        'type': 'annotation',
+        'annotations': [{'type': 'point', 'id': 'a', 'point': [1, 2, 3]}],
+    }, _readonly=True)
+    annotations = layer.annotations
+    with pytest.raises(AttributeError):
+        annotations[0].point = [4, 5, 6]
+    assert annotations.to_json() is annotations.to_json()
+    assert annotations.to_json() == [{'type': 'point', 'id': 'a', 'point': [1, 2, 3]}]
+
+def test_layers_index():
+    layers = viewer_state.Layers([])
+    for name in ['a', 'b', 'c']:
+        layers.append(name, viewer_state.ImageLayer())
+    assert [layers.index(name) for name in ['a', 'b', 'c', 'd']] == [0, 1, 2, -1]
+    name_to_index = layers._name_to_index
+    assert 'x' not in [layer.name for layer in layers]
+    assert layers.index('x') == -1
+    assert layers._name_to_index is name_to_index
+    del layers['a']
+    assert [layers.index(name) for name in ['a', 'b', 'c']] == [-1, 0, 1]
+    layers['c'].name = 'e'
+    assert layers.index('c') == -1
+    assert layers.index('e') == 1
+    layers['d'] = viewer_state.ImageLayer()
+    assert layers.index('d') == 2
+    layers.clear()
+    assert layers.index('b') == -1
+    assert len(layers) == 0
+
+def test_readonly_layers_to_json():
+    json_data = [{'type': 'image', 'name': 'a', 'source': 'precomputed://a', 'visible': False}]
+    layers = viewer_state.Layers(copy.deepcopy(json_data), _readonly=True)
+    assert layers.to_json() == json_data
+    assert layers.to_json() is layers.to_json()
+    assert layers[0].to_json() is layers.to_json()[0]
+    # The layer's own JSON is not modified.
+    assert layers[0].layer.to_json() is not layers[0].to_json()
+
+def test_annotation_instances_copied():
+    point = viewer_state.PointAnnotation(id='1', point=[1, 2, 3])
+    layer1 = viewer_state.AnnotationLayer(annotations=[point])
+    layer2 = viewer_state.AnnotationLayer(annotations=[point])
+    assert layer1.annotations[0] is not point
+    layer1.annotations[0].point[0] = 10
+    assert layer2.annotations[0].point[0] == 1
+    assert point.point[0] == 1
+
+def test_annotation_layer_from_point_array():
+    points = np.arange(12).reshape(4, 3)
+    layer = viewer_state.AnnotationLayer(annotations=points)
+    assert len(layer.annotations) == 4
+    a = layer.annotations[2]
+    assert isinstance(a, viewer_state.PointAnnotation)
+    assert a.type == 'point'
+    np.testing.assert_array_equal(a.point, [6, 7, 8])
+    assert a.point.base is layer.annotations[0].point.base
+    a.point[0] = 20
+    assert layer.to_json()['annotations'][2] == {'point': [20, 7, 8], 'type': 'point'}
+    assert points[2, 0] == 6
+
+    annotations = viewer_state.PointAnnotation.from_arrays(points, ids=range(4), _readonly=True)
+    assert annotations[1].id == '1'
+    assert not annotations[1].point.flags.writeable
+    assert annotations[1].to_json() == {'id': '1', 'point': [3, 4, 5], 'type': 'point'}
+    assert annotations[0].to_json() != annotations[1].to_json()
+    assert annotations[1].point.base is annotations[0].point.base
+    with pytest.raises(ValueError):
+        viewer_state.AnnotationLayer(
+            {'type': 'annotation', 'annotations': points}, _readonly=True).annotations
+
+def test_managed_layer_properties():
+    layer = viewer_state.ManagedLayer('a', viewer_state.ImageLayer(source='precomputed://a'))
+    assert 'source' in vars(viewer_state.ManagedLayer)
+    assert layer.source[0].url == 'precomputed://a'
+    layer.opacity = 0.25
+    assert layer.layer.opacity == 0.25
+    assert layer.opacity == 0.25
+    with pytest.raises(AttributeError):
+        layer.segments  # pylint: disable=pointless-statement
+
+def test_readonly_managed_layer_kwargs():
+    layer = viewer_state.ManagedLayer(
+        'a', {'type': 'image', 'source': 'precomputed://a'}, _readonly=True, visible=False)
+    assert layer.visible is False
+    with pytest.raises(AttributeError):
+        layer.visible = True
+    with pytest.raises(AttributeError):
+        layer.opacity = 0.5
+
+def test_managed_layer_deepcopy():
+    for readonly in [False, True]:
+        layer = viewer_state.ManagedLayer(
+            'a', {'type': 'image', 'source': 'precomputed://a', 'visible': False},
+            _readonly=readonly)
+        layer_copy = copy.deepcopy(layer)
+        assert layer_copy.to_json() == layer.to_json()
+        assert isinstance(layer_copy.layer, viewer_state.ImageLayer)
+        layer_copy.opacity = 0.25
+        assert layer.opacity != 0.25
+
+def test_layer_group_viewer_interpolate():
+    a = viewer_state.LayerGroupViewer(layers=['img'], layout='xy')
+    a.position.link = 'unlinked'
+    a.position.value = [0, 0, 0]
+    a.projection_scale.link = 'unlinked'
+    a.projection_scale.value = 1
+    b = viewer_state.LayerGroupViewer(a.to_json())
+    b.position.value = [2, 4, 6]
+    b.projection_scale.value = 4
+    c = viewer_state.LayerGroupViewer.interpolate(a, b, 0.5)
+    np.testing.assert_allclose(c.position.value, [1, 2, 3])
+    np.testing.assert_allclose(c.projection_scale.value, 2)
+    assert c.cross_section_scale.link == 'linked'
+    assert c.cross_section_scale.value is None
+    assert c.layers.to_json() == ['img']
+    assert c.to_json()['layout'] == 'xy'
+    assert c.to_json()['position'] == {'link': 'unlinked', 'value': [1, 2, 3]}
+
+    state_a = viewer_state.ViewerState()
+    state_a.layout = viewer_state.row_layout([a, viewer_state.DataPanelLayout('3d')])
+    state_b = viewer_state.ViewerState()
+    state_b.layout = viewer_state.row_layout([b, viewer_state.DataPanelLayout('3d')])
+    state_c = viewer_state.ViewerState.interpolate(state_a, state_b, 0.5)
+    layout_json = state_c.to_json()['layout']
+    assert layout_json['children'][0]['position']['value'] == [1, 2, 3]
+    assert layout_json['children'][1] == '3d'
+
+def test_annotation_segments_from_array():
+    segments = np.array([[1, 2**63 + 1], [3, 4]], dtype=np.uint64)
+    a = viewer_state.PointAnnotation(point=[0, 0, 0], segments=segments)
+    assert [[int(x) for x in row] for row in a.segments] == [[1, 2**63 + 1], [3, 4]]
+    assert all(type(x) is np.uint64 for row in a.segments for x in row)
+    assert json.loads(json_utils.encode_json(a.to_json()))['segments'] == [
+        ['1', str(2**63 + 1)], ['3', '4']]
+
+def test_layers_from_mapping():
+    json_data = collections.OrderedDict([('a', {'type': 'image'}), ('b', {'type': 'segmentation'})])
+    for mapping_type in [dict, collections.OrderedDict]:
+        layers = viewer_state.Layers(mapping_type(json_data))
+        assert sorted(layer.name for layer in layers) == ['a', 'b']
+        assert isinstance(layers['b'].layer, viewer_state.SegmentationLayer)
+
+def test_readonly_layer_group_viewer_layout():
+    state = viewer_state.ViewerState()
+    state.layout = viewer_state.row_layout([
+        viewer_state.LayerGroupViewer(layers=['a']),
+        viewer_state.LayerGroupViewer(layers=['b'], layout='3d'),
+    ])
+    readonly = viewer_state.ViewerState(state.to_json(), _readonly=True)
+    children = readonly.layout.children
+    assert [type(x) for x in children] == [viewer_state.LayerGroupViewer] * 2
+    assert children[1].layers.to_json() == ['b']
+    assert children[1].type == 'viewer'
+    c = viewer_state.ViewerState.interpolate(readonly, readonly, 0.5)
+    layout_json = c.to_json()['layout']
+    assert [x['layers'] for x in layout_json['children']] == [['a'], ['b']]
+    assert [x['layout'] for x in layout_json['children']] == ['xy', '3d']
+
+def test_viewer_state_interpolate():
+    a = viewer_state.ViewerState()
+    a.position = [0, 0, 0]
+    a.projection_scale = 1
+    a.layers.append('img', viewer_state.ImageLayer(source='precomputed://a', opacity=0))
+    a.layout = viewer_state.row_layout([
+        viewer_state.DataPanelLayout('xy'),
+        viewer_state.DataPanelLayout('3d'),
+    ])
+    b = viewer_state.ViewerState(a.to_json())
+    b.position = [2, 4, 6]
+    b.projection_scale = 4
+    b.layers['img'].opacity = 1
+    b.cross_section_orientation = [0, 0, 1, 0]
+    c = viewer_state.ViewerState.interpolate(a, b, 0.5)
+    np.testing.assert_allclose(c.cross_section_orientation, [0, 0, 0.5**0.5, 0.5**0.5], atol=1e-4)
+    np.testing.assert_allclose(c.position, [1, 2, 3])
+    np.testing.assert_allclose(c.projection_scale, 2)
+    np.testing.assert_allclose(c.layers['img'].opacity, 0.5)
+    np.testing.assert_allclose(c.projection_orientation, [0, 0, 0, 1], atol=1e-6)
+    assert a.layers['img'].opacity == 0
+    assert c.layout.to_json() == a.layout.to_json()
+    readonly = viewer_state.ViewerState(a.to_json(), _readonly=True)
+    c = viewer_state.ViewerState.interpolate(readonly, b, 0.5)
+    np.testing.assert_allclose(c.layers['img'].opacity, 0.5)
+    assert readonly.layers['img'].opacity == 0